@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import asyncio
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from textwrap import indent as _indent
 
 import click
 
-from .config import CONFIGURABLE_KEYS, get_credentials, get_group_id, load_config, save_config
-from .spond_client import create_event, geocode, get_client, list_events, list_groups
+from . import geocode_cache
+from .config import CONFIGURABLE_KEY_LIST, get_credentials, get_group_id, load_config, save_config
 
 # Peyman + Christian as co-hosts on all events
 DEFAULT_OWNER_IDS = [
@@ -48,13 +48,147 @@ AWAY_DEFAULTS = {
 }
 
 
+def _apply_match_defaults(row: dict, default_duration: int = 75) -> dict:
+    """Merge HOME_DEFAULTS/AWAY_DEFAULTS into a match.
+
+    row has keys type ("home", "away" or ""), heading, time, duration,
+    meetup_prior, description and location; missing or None values take the
+    home/away default. Returns the same keys with defaults applied, plus
+    location_data for home matches without an explicit location.
+    """
+    match_type = (row.get("type") or "").lower()
+    if match_type == "home":
+        defaults = HOME_DEFAULTS
+    elif match_type == "away":
+        defaults = AWAY_DEFAULTS
+    elif match_type:
+        raise click.BadParameter(
+            f"Unknown match type '{row['type']}' (expected home or away)"
+        )
+    else:
+        defaults = {}
+
+    start_time = row.get("time")
+    if start_time is None:
+        start_time = defaults.get("time") or "10:00"
+    duration = row.get("duration")
+    if duration is None:
+        duration = defaults.get("duration") or default_duration
+    meetup_prior = row.get("meetup_prior")
+    if meetup_prior is None:
+        meetup_prior = defaults.get("meetup_prior") or 30
+
+    # Apply heading suffix for away matches
+    heading = row["heading"]
+    suffix = defaults.get("heading_suffix")
+    if suffix and suffix not in heading:
+        heading = heading + suffix
+
+    # Build description
+    description = row.get("description")
+    default_desc = defaults.get("description", "")
+    if description is not None and default_desc:
+        final_description = default_desc + "\n\n" + description
+    elif description is not None:
+        final_description = description
+    else:
+        final_description = default_desc
+
+    # Home matches default to Rothamsted with lat/lng unless a venue is given
+    location = row.get("location")
+    location_data = None
+    if match_type == "home" and location is None:
+        location_data = defaults["location_data"]
+
+    return {
+        "type": match_type,
+        "heading": heading,
+        "time": start_time,
+        "duration": duration,
+        "meetup_prior": meetup_prior,
+        "description": final_description,
+        "location": location,
+        "location_data": location_data,
+    }
+
+
+def _parse_when(
+    date: str | datetime,
+    time_str: str,
+    date_hint: str = "date",
+    time_hint: str = "time",
+) -> datetime:
+    """Combine a YYYY-MM-DD date (or an already parsed datetime) and an HH:MM
+    time into a datetime.
+
+    The hints name the offending option or CSV column in usage errors.
+    """
+    if isinstance(date, str):
+        try:
+            date = datetime.fromisoformat(date)
+        except ValueError:
+            raise click.BadParameter(
+                f"Date must be in YYYY-MM-DD format, got '{date}'",
+                param_hint=date_hint,
+            )
+    try:
+        hour, minute = map(int, time_str.split(":", 1))
+        return date.replace(hour=hour, minute=minute)
+    except ValueError:
+        raise click.BadParameter(
+            f"Time must be in HH:MM format, got '{time_str}'", param_hint=time_hint
+        )
+
+
+def _row_to_event(row: dict) -> dict:
+    """Convert a batch-create CSV row into the event fields to create."""
+    duration_str = (row.get("duration_mins") or "").strip()
+    match = _apply_match_defaults(
+        {
+            "type": (row.get("type") or "").strip(),
+            "heading": row["heading"].strip(),
+            "time": (row.get("time") or "").strip() or None,
+            "duration": int(duration_str) if duration_str else None,
+            "description": (row.get("description") or "").strip() or None,
+            "location": (row.get("location") or "").strip() or None,
+        },
+        default_duration=90,
+    )
+    start = _parse_when(row["date"].strip(), match["time"])
+    return {
+        "heading": match["heading"],
+        "start": start,
+        "end": start + timedelta(minutes=match["duration"]),
+        "duration": match["duration"],
+        "meetup_prior": match["meetup_prior"],
+        "location": match["location"],
+        "location_data": match["location_data"],
+        "description": match["description"],
+    }
+
+
+def _iter_events(path: str):
+    """Yield events from a batch-create CSV one row at a time."""
+    import csv
+
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            yield _row_to_event(row)
+
+
+# asyncio and the Spond client (aiohttp, ssl) are imported inside the commands
+# that need them, so offline commands like config-set start quickly.
 def _run(coro):
-    """Run an async coroutine and ensure the client session is closed."""
-    return asyncio.run(coro)
+    """Run an async coroutine to completion."""
+    from .spond_client import run
+
+    return run(coro)
 
 
 async def _with_client(func, *args, **kwargs):
     """Run an async function with a Spond client, closing the session after."""
+    from .spond_client import get_client
+
     username, password = get_credentials()
     client = await get_client(username, password)
     try:
@@ -76,21 +210,17 @@ def cli():
 )
 def config(username, password):
     """Configure Spond credentials and default group."""
+    from .spond_client import forget_token, list_groups
+
     cfg = load_config()
     cfg["spond_username"] = username
     cfg["spond_password"] = password
     save_config(cfg)
+    # Log in afresh with the new credentials rather than reusing a saved token
+    forget_token()
     click.echo("Credentials saved. Fetching your groups...")
 
-    async def _pick_group():
-        client = await get_client(username, password)
-        try:
-            grps = await list_groups(client)
-        finally:
-            await client.clientsession.close()
-        return grps
-
-    grps = _run(_pick_group())
+    grps = _run(_with_client(list_groups))
 
     if not grps:
         click.echo("No groups found. You can set a group ID later with: fot config")
@@ -118,7 +248,7 @@ def config(username, password):
 
 
 @cli.command("config-set")
-@click.argument("key", type=click.Choice(list(CONFIGURABLE_KEYS.keys()), case_sensitive=False))
+@click.argument("key", type=click.Choice(CONFIGURABLE_KEY_LIST, case_sensitive=False))
 @click.argument("value")
 def config_set(key, value):
     """Set a config value.
@@ -135,30 +265,40 @@ def config_set(key, value):
     click.echo(f"Set {key}.")
 
 
+@cli.group("geocode-cache")
+def geocode_cache_cmd():
+    """Manage the local cache of geocoded venues."""
+    pass
+
+
+@geocode_cache_cmd.command("clear")
+def geocode_cache_clear():
+    """Remove all cached geocoding results."""
+    count = geocode_cache.clear()
+    click.echo(f"Cleared {count} cached location(s).")
+
+
 @cli.command()
 def groups():
     """List your Spond groups and their IDs."""
 
-    async def _list():
-        username, password = get_credentials()
-        client = await get_client(username, password)
-        try:
-            grps = await list_groups(client)
-            if not grps:
-                click.echo("No groups found.")
-                return
-            for g in grps:
-                click.echo(f"\n  Group: {g['name']}")
-                click.echo(f"  ID:    {g['id']}")
-                if "subGroups" in g and g["subGroups"]:
-                    for sg in g["subGroups"]:
-                        click.echo(f"    Subgroup: {sg['name']}  ID: {sg['id']}")
-                member_count = len(g.get("members", []))
-                click.echo(f"  Members: {member_count}")
-        finally:
-            await client.clientsession.close()
-
-    _run(_list())
+    async def _list(client):
+        from .spond_client import list_groups
+
+        grps = await list_groups(client)
+        if not grps:
+            click.echo("No groups found.")
+            return
+        for g in grps:
+            click.echo(f"\n  Group: {g['name']}")
+            click.echo(f"  ID:    {g['id']}")
+            if "subGroups" in g and g["subGroups"]:
+                for sg in g["subGroups"]:
+                    click.echo(f"    Subgroup: {sg['name']}  ID: {sg['id']}")
+            member_count = len(g.get("members", []))
+            click.echo(f"  Members: {member_count}")
+
+    _run(_with_client(_list))
 
 
 @cli.command()
@@ -168,39 +308,33 @@ def groups():
 def events(group_id, upcoming, max_events):
     """List events from Spond."""
 
-    async def _list():
-        username, password = get_credentials()
-        client = await get_client(username, password)
-        gid = group_id or load_config().get("group_id")
-        try:
-            min_start = datetime.utcnow() if upcoming else None
-            evts = await list_events(
-                client, group_id=gid, min_start=min_start, max_events=max_events
-            )
-            if not evts:
-                click.echo("No events found.")
-                return
-            for e in evts:
-                start = e.get("startTimestamp", "?")[:16].replace("T", " ")
-                heading = e.get("heading", "(no title)")
-                eid = e["id"]
-                accepted = sum(
-                    1
-                    for r in e.get("responses", {}).get("acceptedIds", [])
-                )
-                declined = sum(
-                    1
-                    for r in e.get("responses", {}).get("declinedIds", [])
-                )
-                click.echo(f"\n  {start}  {heading}")
-                click.echo(f"  ID: {eid}")
-                click.echo(f"  Accepted: {accepted}  Declined: {declined}")
-                if e.get("location", {}).get("address"):
-                    click.echo(f"  Location: {e['location']['address']}")
-        finally:
-            await client.clientsession.close()
+    gid = group_id or load_config().get("group_id")
 
-    _run(_list())
+    min_start = datetime.now(timezone.utc) if upcoming else None
+
+    async def _list(client):
+        from .spond_client import list_events
+
+        evts = await list_events(
+            client, group_id=gid, min_start=min_start, max_events=max_events
+        )
+        if not evts:
+            click.echo("No events found.")
+            return
+        for e in evts:
+            start = e.get("startTimestamp", "?")[:16].replace("T", " ")
+            heading = e.get("heading", "(no title)")
+            eid = e["id"]
+            resp = e.get("responses") or {}
+            accepted = len(resp.get("acceptedIds") or ())
+            declined = len(resp.get("declinedIds") or ())
+            click.echo(f"\n  {start}  {heading}")
+            click.echo(f"  ID: {eid}")
+            click.echo(f"  Accepted: {accepted}  Declined: {declined}")
+            if e.get("location", {}).get("address"):
+                click.echo(f"  Location: {e['location']['address']}")
+
+    _run(_with_client(_list))
 
 
 @cli.command("create")
@@ -233,86 +367,71 @@ def create_cmd(heading, date, start_time, duration, description, location, meetu
         raise click.UsageError("Cannot use both --home and --away.")
     gid = group_id or get_group_id()
 
-    # Apply home/away defaults
-    if home:
-        defaults = HOME_DEFAULTS
-    elif away:
-        defaults = AWAY_DEFAULTS
-    else:
-        defaults = {}
-    location_data = None
-
-    if start_time is None:
-        start_time = defaults.get("time") or "10:00"
-    if duration is None:
-        duration = defaults.get("duration") or 75
-    if meetup_prior is None:
-        meetup_prior = defaults.get("meetup_prior") or 30
+    match = _apply_match_defaults(
+        {
+            "type": "home" if home else "away" if away else "",
+            "heading": heading,
+            "time": start_time,
+            "duration": duration,
+            "meetup_prior": meetup_prior,
+            "description": description,
+            "location": location,
+        }
+    )
+    heading = match["heading"]
+    duration = match["duration"]
+    meetup_prior = match["meetup_prior"]
+    final_description = match["description"]
+
+    start = _parse_when(date, match["time"], time_hint="--time")
+    end = start + timedelta(minutes=duration)
+    meetup = start - timedelta(minutes=meetup_prior)
 
-    # Apply heading suffix for away matches
-    if away and "heading_suffix" in defaults and defaults["heading_suffix"] not in heading:
-        heading = heading + defaults["heading_suffix"]
+    # Geocoding, the confirmation prompt and event creation share one event
+    # loop, so the Spond client is only opened once it's actually needed.
+    async def _create():
+        import asyncio
 
-    # Build description
-    default_desc = defaults.get("description", "")
-    if description is not None and default_desc:
-        final_description = default_desc + "\n\n" + description
-    elif description is not None:
-        final_description = description
-    else:
-        final_description = default_desc
+        from .spond_client import create_event, geocode
 
-    # Location: --home uses Rothamsted with lat/lng, explicit --location gets geocoded
-    if home and location is None:
-        location_data = defaults["location_data"]
-        location_display = location_data["address"]
-    elif location:
-        click.echo(f"  Geocoding '{location}'...")
-        location_data = _run(geocode(location))
+        # Location: --home uses Rothamsted with lat/lng, explicit --location gets geocoded
+        location_data = match["location_data"]
         if location_data:
             location_display = location_data["address"]
-            click.echo(f"  Found: {location_display}")
-            click.echo(f"  Coords: {location_data['latitude']}, {location_data['longitude']}")
+        elif location:
+            click.echo(f"  Geocoding '{location}'...")
+            location_data = await geocode(location)
+            if location_data:
+                location_display = location_data["address"]
+                click.echo(f"  Found: {location_display}")
+                click.echo(f"  Coords: {location_data['latitude']}, {location_data['longitude']}")
+            else:
+                click.echo(f"  Geocoding failed, using location string as-is.")
+                location_display = location
         else:
-            click.echo(f"  Geocoding failed, using location string as-is.")
-            location_display = location
-    else:
-        location_display = None
-
-    # Parse time
-    try:
-        hour, minute = map(int, start_time.split(":"))
-    except ValueError:
-        raise click.BadParameter("Time must be in HH:MM format", param_hint="--time")
-
-    start = date.replace(hour=hour, minute=minute)
-    end = start + timedelta(minutes=duration)
-    meetup = start - timedelta(minutes=meetup_prior)
-
-    click.echo(f"\n  Event:    {heading}")
-    if home or away:
-        click.echo(f"  Type:     {'HOME' if home else 'AWAY'}")
-    click.echo(f"  Date:     {start.strftime('%a %d %b %Y')}")
-    click.echo(f"  Meetup:   {meetup.strftime('%H:%M')}")
-    click.echo(f"  Kick-off: {start.strftime('%H:%M')} - {end.strftime('%H:%M')}")
-    click.echo(f"  Duration: {duration} min")
-    if location_display:
-        click.echo(f"  Location: {location_display}")
-    if final_description:
-        click.echo(f"  Description:\n    {final_description.replace(chr(10), chr(10) + '    ')}")
-
-    if dry_run:
-        click.echo("\n  [DRY RUN] Event not created.")
-        return
-
-    if not yes and not click.confirm("\n  Create this event?"):
-        click.echo("  Cancelled.")
-        return
-
-    async def _create():
-        username, password = get_credentials()
-        client = await get_client(username, password)
-        try:
+            location_display = None
+
+        click.echo(f"\n  Event:    {heading}")
+        if home or away:
+            click.echo(f"  Type:     {'HOME' if home else 'AWAY'}")
+        click.echo(f"  Date:     {start.strftime('%a %d %b %Y')}")
+        click.echo(f"  Meetup:   {meetup.strftime('%H:%M')}")
+        click.echo(f"  Kick-off: {start.strftime('%H:%M')} - {end.strftime('%H:%M')}")
+        click.echo(f"  Duration: {duration} min")
+        if location_display:
+            click.echo(f"  Location: {location_display}")
+        if final_description:
+            click.echo(f"  Description:\n{_indent(final_description, '    ')}")
+
+        if dry_run:
+            click.echo("\n  [DRY RUN] Event not created.")
+            return
+
+        if not yes and not await asyncio.to_thread(click.confirm, "\n  Create this event?"):
+            click.echo("  Cancelled.")
+            return
+
+        async def _post(client):
             result = await create_event(
                 client,
                 group_id=gid,
@@ -327,8 +446,8 @@ def create_cmd(heading, date, start_time, duration, description, location, meetu
                 owner_ids=DEFAULT_OWNER_IDS,
             )
             click.echo(f"\n  Event created! ID: {result.get('id', '?')}")
-        finally:
-            await client.clientsession.close()
+
+        await _with_client(_post)
 
     _run(_create())
 
@@ -336,90 +455,82 @@ def create_cmd(heading, date, start_time, duration, description, location, meetu
 @cli.command("batch-create")
 @click.argument("file", type=click.Path(exists=True))
 @click.option("--group-id", default=None, help="Group ID (uses default if not set)")
+@click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt")
 @click.option("--dry-run", is_flag=True, help="Show what would be created without creating")
-def batch_create(file, group_id, dry_run):
+def batch_create(file, group_id, yes, dry_run):
     """Create multiple events from a CSV file.
 
-    CSV columns: heading, date (YYYY-MM-DD), time (HH:MM), duration_mins, location, description
+    CSV columns: heading, date (YYYY-MM-DD), time (HH:MM), duration_mins, location, description, type
+
+    The optional type column (home/away) applies the same defaults as
+    --home/--away on the create command; blank cells fall back to them.
 
     Example CSV:
     \b
-    heading,date,time,duration_mins,location,description
-    Match vs Arsenal U10,2026-03-07,10:00,90,Hackney Marshes,League match
-    Match vs Chelsea U10,2026-03-14,14:00,90,Victoria Park,Cup match
+    heading,date,time,duration_mins,location,description,type
+    Match vs Arsenal U10,2026-03-07,10:00,90,Hackney Marshes,League match,
+    Match vs Chelsea U10,2026-03-14,14:00,90,Victoria Park,Cup match,
+    HOME vs Spurs U10,2026-03-21,,,,,home
     """
-    import csv
-
     gid = group_id or get_group_id()
 
-    with open(file) as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
+    # The CSV is streamed twice (preview, then create) rather than held in
+    # memory; only the set of venues to geocode is kept between passes.
+    count = 0
+    unique_locs = set()
+    for evt in _iter_events(file):
+        if not count:
+            click.echo("\nEvents to create:\n")
+        count += 1
+        start, end = evt["start"], evt["end"]
+        click.echo(
+            f"  {start.strftime('%a %d %b %H:%M')}-{end.strftime('%H:%M')}  {evt['heading']}"
+        )
+        if evt["location_data"]:
+            click.echo(f"    Location: {evt['location_data']['address']}")
+        elif evt["location"]:
+            click.echo(f"    Location: {evt['location']}")
+            unique_locs.add(evt["location"])
 
-    if not rows:
+    if not count:
         click.echo("No events found in CSV.")
         return
 
-    click.echo(f"\nFound {len(rows)} event(s) to create:\n")
-    events_to_create = []
-
-    for row in rows:
-        heading = row["heading"].strip()
-        date_str = row["date"].strip()
-        time_str = row["time"].strip()
-        duration = int(row.get("duration_mins", "90").strip() or "90")
-        location = row.get("location", "").strip() or None
-        description = row.get("description", "").strip()
-
-        date = datetime.strptime(date_str, "%Y-%m-%d")
-        hour, minute = map(int, time_str.split(":"))
-        start = date.replace(hour=hour, minute=minute)
-        end = start + timedelta(minutes=duration)
-
-        events_to_create.append(
-            {
-                "heading": heading,
-                "start": start,
-                "end": end,
-                "duration": duration,
-                "location": location,
-                "description": description,
-            }
-        )
-
-        click.echo(
-            f"  {start.strftime('%a %d %b %H:%M')}-{end.strftime('%H:%M')}  {heading}"
-        )
-        if location:
-            click.echo(f"    Location: {location}")
-
     if dry_run:
-        click.echo("\n[DRY RUN] No events created.")
+        click.echo(f"\n[DRY RUN] {count} event(s), none created.")
         return
 
-    if not click.confirm(f"\nCreate all {len(events_to_create)} events?"):
+    if not yes and not click.confirm(f"\nCreate all {count} events?"):
         click.echo("Cancelled.")
         return
 
-    async def _batch():
-        username, password = get_credentials()
-        client = await get_client(username, password)
-        try:
-            for evt in events_to_create:
-                result = await create_event(
-                    client,
-                    group_id=gid,
-                    heading=evt["heading"],
-                    start=evt["start"],
-                    end=evt["end"],
-                    description=evt["description"],
-                    location=evt["location"],
-                    owner_ids=DEFAULT_OWNER_IDS,
-                )
+    async def _batch(client):
+        from .spond_client import create_events, geocode_many
+
+        # Geocode each distinct venue once, however many fixtures share it
+        geo_map = dict(zip(unique_locs, await geocode_many(unique_locs)))
+
+        def _to_create():
+            for evt in _iter_events(file):
+                location_data = evt["location_data"] or geo_map.get(evt["location"])
+                yield {
+                    "heading": evt["heading"],
+                    "start": evt["start"],
+                    "end": evt["end"],
+                    "description": evt["description"],
+                    "location": evt["location"] if not location_data else None,
+                    "location_data": location_data,
+                    "meetup_prior": evt["meetup_prior"],
+                }
+
+        async for evt, result in create_events(
+            client, gid, _to_create(), owner_ids=DEFAULT_OWNER_IDS
+        ):
+            if isinstance(result, Exception):
+                click.echo(f"  Failed:  {evt['heading']} -> {result}")
+            else:
                 click.echo(
                     f"  Created: {evt['heading']} -> ID: {result.get('id', '?')}"
                 )
-        finally:
-            await client.clientsession.close()
 
-    _run(_batch())
+    _run(_with_client(_batch))
@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
+import os
+import tempfile
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 CONFIG_DIR = Path.home() / ".config" / "footballorganisertoolkit"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
@@ -14,17 +22,103 @@ CONFIGURABLE_KEYS = {
     "group_id": "Default Spond group ID",
     "group_name": "Default Spond group name (display only)",
 }
+CONFIGURABLE_KEY_LIST = tuple(CONFIGURABLE_KEYS)
+
+
+# In-process copy of the config file, keyed on its mtime so edits made by
+# another process are still picked up. _CACHE_RAW is the file's raw bytes, used
+# to skip writes that wouldn't change anything.
+_CACHE: dict | None = None
+_CACHE_MTIME: float | None = None
+_CACHE_RAW: bytes | None = None
+_DIR_READY = False
+
+
+def _loads(data: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(config: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(
+            config, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+    return (json.dumps(config, indent=2) + "\n").encode("utf-8")
+
+
+def _read_bytes(path: Path) -> bytes:
+    """Read a small file with as few syscalls as possible (usually one read)."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        chunks = [os.read(fd, 65536)]
+        # A short read on a regular file means EOF
+        while len(chunks[-1]) == 65536:
+            chunks.append(os.read(fd, 65536))
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
+def atomic_write(path: Path, data: bytes, mode: int = 0o600) -> None:
+    """Replace path with data so a crash never leaves a truncated file.
+
+    Each call writes its own temp file in path's directory and renames it over
+    path, so processes saving at the same time can't clobber each other's temp
+    file; the last rename wins. The file is owner-only unless mode says
+    otherwise.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        if mode != 0o600:
+            os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
 
 
 def load_config() -> dict:
-    if not CONFIG_FILE.exists():
+    global _CACHE, _CACHE_MTIME, _CACHE_RAW
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime
+        if _CACHE is None or mtime != _CACHE_MTIME:
+            _CACHE_RAW = _read_bytes(CONFIG_FILE)
+            _CACHE = _loads(_CACHE_RAW)
+            _CACHE_MTIME = mtime
+    except FileNotFoundError:
+        _CACHE, _CACHE_MTIME, _CACHE_RAW = {}, None, None
         return {}
-    return json.loads(CONFIG_FILE.read_text())
+    # Values are all scalars, so a shallow copy keeps callers from mutating the cache
+    return dict(_CACHE)
 
 
 def save_config(config: dict) -> None:
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    CONFIG_FILE.write_text(json.dumps(config, indent=2) + "\n")
+    global _CACHE, _CACHE_MTIME, _CACHE_RAW, _DIR_READY
+    raw = _dumps(config)
+    if raw == _CACHE_RAW:
+        try:
+            if os.stat(CONFIG_FILE).st_mtime == _CACHE_MTIME:
+                return
+        except FileNotFoundError:
+            pass
+    if not _DIR_READY:
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        _DIR_READY = True
+    # The file holds the Spond password: keep the existing file's permissions,
+    # and make a new one owner-only
+    try:
+        mode = os.stat(CONFIG_FILE).st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o600
+    atomic_write(CONFIG_FILE, raw, mode)
+    _CACHE = dict(config)
+    _CACHE_MTIME = os.stat(CONFIG_FILE).st_mtime
+    _CACHE_RAW = raw
 
 
 def get_credentials() -> tuple[str, str]:
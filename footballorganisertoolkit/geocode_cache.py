@@ -0,0 +1,94 @@
+"""On-disk cache of geocoding results, keyed by provider, country and query."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+import unicodedata
+from typing import Any
+
+from .config import CONFIG_DIR, atomic_write
+
+CACHE_FILE = CONFIG_DIR / "geocode_cache.json"
+
+# Least recently used entries are dropped beyond this many
+MAX_ENTRIES = 500
+
+# Seconds before an entry is considered stale and looked up again
+TTL = 86400
+
+# In-process copy of the cache file, keyed on its mtime like config.load_config()
+_CACHE: dict[str, Any] | None = None
+_CACHE_MTIME: float | None = None
+
+
+def make_key(provider: str, country: str, query: str) -> str:
+    """Build a cache key; case, whitespace and Unicode form differences in the
+    query all map to the same entry."""
+    normalized = " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+    return f"{provider}:{country.lower()}:{normalized}"
+
+
+def _load() -> dict[str, Any]:
+    global _CACHE, _CACHE_MTIME
+    try:
+        mtime = os.stat(CACHE_FILE).st_mtime
+    except FileNotFoundError:
+        if _CACHE is None or _CACHE_MTIME is not None:
+            _CACHE, _CACHE_MTIME = {}, None
+        return _CACHE
+    if _CACHE is None or mtime != _CACHE_MTIME:
+        try:
+            entries = json.loads(CACHE_FILE.read_text())
+        except (OSError, ValueError):
+            # An unreadable or corrupt cache just means every lookup misses;
+            # the next put() overwrites it
+            entries = None
+        _CACHE = entries if isinstance(entries, dict) else {}
+        _CACHE_MTIME = mtime
+    return _CACHE
+
+
+def _save(entries: dict[str, Any]) -> None:
+    global _CACHE_MTIME
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    atomic_write(CACHE_FILE, (json.dumps(entries, indent=2) + "\n").encode("utf-8"))
+    _CACHE_MTIME = os.stat(CACHE_FILE).st_mtime
+
+
+def get(key: str, allow_stale: bool = False) -> dict[str, Any] | None:
+    """Return the cached result for a key, or None on a miss.
+
+    Stale entries count as misses unless allow_stale is set.
+    """
+    entries = _load()
+    entry = entries.get(key)
+    if not isinstance(entry, dict) or "data" not in entry:
+        return None
+    if not allow_stale and entry.get("stale_at", 0) <= time.time():
+        return None
+    # Mark as most recently used; the order is persisted on the next put()
+    entries[key] = entries.pop(key)
+    return entry["data"]
+
+
+def put(key: str, location_data: dict[str, Any], ttl: float = TTL) -> None:
+    """Store a result, evicting the least recently used entries over MAX_ENTRIES."""
+    entries = _load()
+    now = time.time()
+    entries.pop(key, None)
+    entries[key] = {"data": location_data, "generated_at": now, "stale_at": now + ttl}
+    while len(entries) > MAX_ENTRIES:
+        del entries[next(iter(entries))]
+    _save(entries)
+
+
+def clear() -> int:
+    """Remove every cached result, returning how many were dropped."""
+    global _CACHE, _CACHE_MTIME
+    count = len(_load())
+    # Unlinked even if it couldn't be parsed, so this always recovers a bad file
+    CACHE_FILE.unlink(missing_ok=True)
+    _CACHE, _CACHE_MTIME = {}, None
+    return count
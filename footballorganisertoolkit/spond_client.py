@@ -3,15 +3,160 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
+import json
+import logging
+import time
+import weakref
 from datetime import datetime, timedelta
-from typing import Any
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable
 
 import aiohttp
 from spond.spond import Spond
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Event loop runner for the sync entry points: uvloop's when installed
+try:
+    import uvloop
+
+    _RUN = uvloop.run
+except ImportError:
+    _RUN = asyncio.run
+
+from . import geocode_cache
+from .config import CONFIG_DIR, atomic_write, load_config
+
+logger = logging.getLogger(__name__)
+
 NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
 GOOGLE_GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
 
+# (Google address component type, Spond location key, component attribute)
+_GOOGLE_FIELD_MAP = (
+    ("postal_code", "postalCode", "long_name"),
+    ("country", "country", "short_name"),
+    ("administrative_area_level_1", "administrativeAreaLevel1", "long_name"),
+    ("administrative_area_level_2", "administrativeAreaLevel2", "long_name"),
+)
+
+# Limits for geocode_many(). Nominatim's usage policy allows at most one
+# request per second; Google's quota is far more generous.
+GOOGLE_CONCURRENCY = 10
+NOMINATIM_INTERVAL = 1.0
+
+# time.monotonic() of the last Nominatim request, for pacing the next one
+_NOMINATIM_LAST = float("-inf")
+
+# Connection pool for the Spond API session. Keep-alive lets batch operations
+# reuse TCP/TLS connections instead of handshaking per request.
+POOL_LIMIT = 100
+POOL_LIMIT_PER_HOST = 20
+POOL_KEEPALIVE_TIMEOUT = 30
+
+# Login token saved between invocations so each CLI run doesn't log in again.
+# Treated as expired well before Spond would reject it.
+TOKEN_FILE = CONFIG_DIR / "token.json"
+TOKEN_TTL = 3300
+
+# Fields that are the same for every event we create. Only immutable values
+# belong here: the mapping is read-only but its values are shared by every
+# payload, so the dict and list fields are built per event in _event_payload().
+_EVENT_TEMPLATE = MappingProxyType(
+    {
+        "commentsDisabled": False,
+        "maxAccepted": 0,
+        "rsvpDate": None,
+        "visibility": "INVITEES",
+        "participantsHidden": False,
+        "autoReminderType": "DISABLED",
+        "autoAccept": False,
+        "hidden": False,
+        "type": "AVAILABILITY",
+        "matchEvent": False,
+    }
+)
+
+# Shared session for geocoding requests, bound to the loop that created it
+_SESSION: aiohttp.ClientSession | None = None
+_SESSION_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+def _dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_serialize(value: Any) -> str:
+    """JSON encoder for aiohttp's json= arguments."""
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value)
+
+
+def spond_timestamp(dt: datetime) -> str:
+    """Format a datetime the way the Spond API expects (YYYY-MM-DDTHH:MM:SS.000Z).
+
+    Equivalent to dt.strftime("%Y-%m-%dT%H:%M:%S.000Z") without going through
+    strftime's format parser.
+    """
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}.000Z"
+    )
+
+
+async def _session() -> aiohttp.ClientSession:
+    """Return the shared geocoding session, creating it on first use."""
+    global _SESSION, _SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    if _SESSION is None or _SESSION.closed or _SESSION_LOOP is not loop:
+        _SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=32, limit_per_host=4, ttl_dns_cache=300
+            ),
+            timeout=aiohttp.ClientTimeout(total=10),
+        )
+        _SESSION_LOOP = loop
+    return _SESSION
+
+
+async def close_session() -> None:
+    """Close the shared geocoding session, if one is open."""
+    global _SESSION, _SESSION_LOOP
+    if _SESSION is not None:
+        await _SESSION.close()
+    _SESSION = _SESSION_LOOP = None
+
+
+def run(coro):
+    """Run a coroutine to completion, then close the shared geocoding session.
+
+    aiohttp sessions can't be closed once their loop has gone, so sync entry
+    points should use this rather than calling asyncio.run() directly. Uses
+    uvloop's faster event loop when it is installed.
+    """
+
+    async def _main():
+        try:
+            return await coro
+        finally:
+            await close_session()
+
+    return _RUN(_main())
+
 
 async def _geocode_google(
     query: str, api_key: str, country: str = "gb"
@@ -22,13 +167,13 @@ async def _geocode_google(
         "key": api_key,
         "region": country,
     }
-    async with aiohttp.ClientSession() as session:
-        async with session.get(GOOGLE_GEOCODE_URL, params=params) as r:
-            if not r.ok:
-                return None
-            data = await r.json()
-            if data.get("status") != "OK" or not data.get("results"):
-                return None
+    session = await _session()
+    async with session.get(GOOGLE_GEOCODE_URL, params=params) as r:
+        if not r.ok:
+            return None
+        data = _loads(await r.read())
+        if data.get("status") != "OK" or not data.get("results"):
+            return None
 
     result = data["results"][0]
     geo = result["geometry"]["location"]
@@ -47,18 +192,10 @@ async def _geocode_google(
         "longitude": geo["lng"],
     }
 
-    if "postal_code" in addr_components:
-        location_data["postalCode"] = addr_components["postal_code"]["long_name"]
-    if "country" in addr_components:
-        location_data["country"] = addr_components["country"]["short_name"]
-    if "administrative_area_level_1" in addr_components:
-        location_data["administrativeAreaLevel1"] = addr_components[
-            "administrative_area_level_1"
-        ]["long_name"]
-    if "administrative_area_level_2" in addr_components:
-        location_data["administrativeAreaLevel2"] = addr_components[
-            "administrative_area_level_2"
-        ]["long_name"]
+    for src, dst, attr in _GOOGLE_FIELD_MAP:
+        component = addr_components.get(src)
+        if component:
+            location_data[dst] = component[attr]
 
     return location_data
 
@@ -76,13 +213,13 @@ async def _geocode_nominatim(
     }
     headers = {"User-Agent": "footballorganisertoolkit/0.1.0"}
 
-    async with aiohttp.ClientSession() as session:
-        async with session.get(NOMINATIM_URL, params=params, headers=headers) as r:
-            if not r.ok:
-                return None
-            results = await r.json()
-            if not results:
-                return None
+    session = await _session()
+    async with session.get(NOMINATIM_URL, params=params, headers=headers) as r:
+        if not r.ok:
+            return None
+        results = _loads(await r.read())
+        if not results:
+            return None
 
     result = results[0]
     addr = result.get("address", {})
@@ -96,12 +233,8 @@ async def _geocode_nominatim(
         or addr.get("suburb")
         or ""
     )
-    short_parts = [name]
-    if road and road != name:
-        short_parts.append(road)
-    if town and town != name and town != road:
-        short_parts.append(town)
-    short_address = ", ".join(short_parts)
+    # Drop empty and repeated parts, keeping their order
+    short_address = ", ".join(dict.fromkeys(p for p in (name, road, town) if p))
 
     location_data: dict[str, Any] = {
         "feature": query,
@@ -124,26 +257,263 @@ async def _geocode_nominatim(
     return location_data
 
 
-async def geocode(query: str, country: str = "gb") -> dict[str, Any] | None:
-    """Geocode a location string. Uses Google Maps if an API key is configured,
-    otherwise falls back to OpenStreetMap Nominatim."""
-    from .config import load_config
+@functools.lru_cache(maxsize=1)
+def _google_key() -> str | None:
+    """The configured Google Maps API key, read once per process."""
+    return load_config().get("google_maps_api_key")
+
+
+async def _pace_nominatim(gated: bool) -> None:
+    """Record a Nominatim request about to be made. When gated, first wait out
+    whatever is left of NOMINATIM_INTERVAL since the previous one."""
+    global _NOMINATIM_LAST
+    if gated:
+        wait = _NOMINATIM_LAST + NOMINATIM_INTERVAL - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+    _NOMINATIM_LAST = time.monotonic()
+
+
+async def _geocode(
+    query: str,
+    country: str,
+    must_be_fresh: bool = False,
+    google_gate: asyncio.Semaphore | None = None,
+    nominatim_gate: asyncio.Semaphore | None = None,
+) -> dict[str, Any] | None:
+    """Look up a query via Google, then Nominatim, checking each one's cache first.
 
-    api_key = load_config().get("google_maps_api_key")
+    A provider that errors or finds nothing falls through to the next. If
+    none of them answers, a stale cached result is returned instead unless
+    must_be_fresh is set. The optional gates throttle each provider when many
+    lookups run at once.
+    """
+    providers = []
+    api_key = _google_key()
     if api_key:
-        return await _geocode_google(query, api_key, country)
-    return await _geocode_nominatim(query, country)
+        google = functools.partial(_geocode_google, query, api_key, country)
+        providers.append(("google", google_gate, google))
+    nominatim = functools.partial(_geocode_nominatim, query, country)
+    providers.append(("nominatim", nominatim_gate, nominatim))
+
+    keys = []
+    error = None
+    for provider, gate, lookup in providers:
+        # Cached under the provider that answered, so one never shadows another
+        key = geocode_cache.make_key(provider, country, query)
+        keys.append(key)
+        cached = geocode_cache.get(key)
+        if cached is not None:
+            return cached
+        try:
+            async with gate or contextlib.nullcontext():
+                if provider == "nominatim":
+                    await _pace_nominatim(gated=gate is not None)
+                location_data = await lookup()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning("Geocoding '%s' via %s failed: %r", query, provider, e)
+            error = e
+            continue
+        if location_data is not None:
+            geocode_cache.put(key, location_data)
+            return location_data
+
+    if not must_be_fresh:
+        for key in keys:
+            stale = geocode_cache.get(key, allow_stale=True)
+            if stale is not None:
+                logger.warning(
+                    "Geocoding '%s' failed; using a stale cached result", query
+                )
+                return stale
+    if error is not None:
+        raise error
+    return None
+
+
+async def geocode(
+    query: str, country: str = "gb", must_be_fresh: bool = False
+) -> dict[str, Any] | None:
+    """Geocode a location string. Uses Google Maps if an API key is configured,
+    falling back to OpenStreetMap Nominatim if there is no key or Google fails
+    or finds nothing.
+
+    Successful results are cached on disk for geocode_cache.TTL seconds, so
+    repeat venues skip the network. If the lookup fails, an expired cached
+    result is returned instead, unless must_be_fresh is set.
+    """
+    return await _geocode(query, country, must_be_fresh)
+
+
+async def geocode_many(
+    queries: Iterable[str], country: str = "gb", must_be_fresh: bool = False
+) -> list[dict[str, Any] | None]:
+    """Geocode several location strings concurrently, in the same order.
+
+    Cached queries return immediately. Uncached ones go to Google (up to
+    GOOGLE_CONCURRENCY at once) when a key is configured, and to Nominatim one
+    at a time at most once per NOMINATIM_INTERVAL otherwise, or when Google
+    fails or finds nothing. Duplicate queries are only looked up once. Failed lookups
+    fall back to stale cached results as in geocode(); a query that still
+    fails gives None, like one that found nothing, rather than raising.
+    """
+    queries = list(queries)
+    unique = list(dict.fromkeys(queries))
+    google_gate = asyncio.Semaphore(GOOGLE_CONCURRENCY)
+    nominatim_gate = asyncio.Semaphore(1)
+    results = await asyncio.gather(
+        *[
+            _geocode(q, country, must_be_fresh, google_gate, nominatim_gate)
+            for q in unique
+        ],
+        return_exceptions=True,
+    )
+    by_query = {}
+    for q, result in zip(unique, results):
+        if isinstance(result, Exception):
+            logger.warning("Could not geocode '%s': %r", q, result)
+            result = None
+        by_query[q] = result
+    return [by_query[q] for q in queries]
+
+
+def _load_token(username: str) -> str | None:
+    """Return the saved login token for username, if it hasn't expired."""
+    try:
+        saved = _loads(TOKEN_FILE.read_bytes())
+    except (FileNotFoundError, ValueError):
+        return None
+    if saved.get("username") != username or saved.get("expires_at", 0) <= time.time():
+        return None
+    return saved.get("token")
+
+
+def _save_token(username: str, token: str) -> None:
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    payload = {"username": username, "token": token, "expires_at": time.time() + TOKEN_TTL}
+    # Owner-only permissions: the token grants full access to the account
+    atomic_write(TOKEN_FILE, _dumps(payload))
+
+
+def forget_token() -> None:
+    """Delete the saved login token, forcing the next client to log in."""
+    TOKEN_FILE.unlink(missing_ok=True)
+
+
+async def login(client: Spond) -> None:
+    """Log the client in and save its token for later invocations."""
+    await client.login()
+    _save_token(client.username, client.token)
+
+
+# One lock per client, so concurrent requests that all get a 401 log in once
+_LOGIN_LOCKS: weakref.WeakKeyDictionary[Spond, asyncio.Lock] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _relogin(client: Spond, rejected_token: str | None) -> None:
+    """Log in again after the API rejected rejected_token."""
+    async with _LOGIN_LOCKS.setdefault(client, asyncio.Lock()):
+        # Another concurrent request may already have refreshed it
+        if client.token == rejected_token:
+            forget_token()
+            await login(client)
+
+
+async def fetch_with_relogin(
+    client: Spond, fetch: Callable[[], Awaitable[Any]], what: str
+) -> list[dict]:
+    """Await fetch(), a spond listing call such as client.get_events, and
+    return its list. If Spond rejects the token, log in again and retry once.
+
+    spond reports a failed listing differently per call: get_events() raises
+    ValueError with the HTTP status in its message, while get_groups() returns
+    the error body instead of a list.
+    """
+    for attempt in range(2):
+        token = client.token
+        try:
+            result = await fetch()
+        except ValueError as e:
+            if attempt or not str(e).startswith("Request failed with status 401"):
+                raise
+        else:
+            if isinstance(result, list) or result is None:
+                return result or []
+            if attempt:
+                raise RuntimeError(f"Failed to list {what}: {result}")
+        await _relogin(client, token)
 
 
 async def get_client(username: str, password: str) -> Spond:
-    """Create and authenticate a Spond client."""
-    return Spond(username=username, password=password)
+    """Create and authenticate a Spond client.
+
+    The session created by the spond package uses aiohttp's default connector
+    and JSON encoder, so it is swapped for one with an explicit keep-alive pool
+    that serialises request bodies with orjson when available.
+
+    A token saved by a previous invocation is reused if it is still fresh;
+    otherwise the client logs in and saves the new token. Calls that go through
+    this module log in again if Spond has since revoked the saved token.
+    """
+    client = Spond(username=username, password=password)
+    await client.clientsession.close()
+    client.clientsession = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=POOL_LIMIT,
+            limit_per_host=POOL_LIMIT_PER_HOST,
+            keepalive_timeout=POOL_KEEPALIVE_TIMEOUT,
+            enable_cleanup_closed=True,
+        ),
+        cookie_jar=aiohttp.CookieJar(),
+        json_serialize=_json_serialize,
+    )
+    client.token = _load_token(username)
+    if not client.token:
+        try:
+            await login(client)
+        except BaseException:
+            await client.clientsession.close()
+            raise
+    return client
+
+
+# Short-lived in-process cache of group/event listings, so repeated calls in
+# one process (e.g. a skill listing events several times) skip the round trip.
+LIST_CACHE_TTL = 15
+LIST_CACHE_SIZE = 64
+_LIST_CACHE: dict[tuple, tuple[float, list[dict]]] = {}
+
+
+def _list_cache_get(key: tuple) -> list[dict] | None:
+    hit = _LIST_CACHE.get(key)
+    if hit is None or hit[0] <= time.monotonic():
+        return None
+    return hit[1]
+
+
+def _list_cache_set(key: tuple, value: list[dict]) -> None:
+    _LIST_CACHE.pop(key, None)
+    while len(_LIST_CACHE) >= LIST_CACHE_SIZE:
+        del _LIST_CACHE[next(iter(_LIST_CACHE))]
+    _LIST_CACHE[key] = (time.monotonic() + LIST_CACHE_TTL, value)
+
+
+def invalidate_list_cache() -> None:
+    """Forget cached listings, e.g. after creating or updating an event."""
+    _LIST_CACHE.clear()
 
 
 async def list_groups(client: Spond) -> list[dict]:
     """List all groups the user has access to."""
-    groups = await client.get_groups()
-    return groups or []
+    key = ("groups", client.username)
+    groups = _list_cache_get(key)
+    if groups is None:
+        groups = await fetch_with_relogin(client, client.get_groups, "groups")
+        _list_cache_set(key, groups)
+    # A copy, so callers can't change the cached listing
+    return list(groups)
 
 
 async def list_events(
@@ -153,15 +523,26 @@ async def list_events(
     max_events: int = 20,
 ) -> list[dict]:
     """List events, optionally filtered by group and date."""
-    return await client.get_events(
-        group_id=group_id,
-        min_start=min_start,
-        max_events=max_events,
-    ) or []
+    # Bucket min_start to the minute so calls made moments apart share an entry
+    bucket = min_start.replace(second=0, microsecond=0) if min_start else None
+    key = ("events", client.username, group_id, bucket, max_events)
+    events = _list_cache_get(key)
+    if events is None:
+        events = await fetch_with_relogin(
+            client,
+            functools.partial(
+                client.get_events,
+                group_id=group_id,
+                min_start=min_start,
+                max_events=max_events,
+            ),
+            "events",
+        )
+        _list_cache_set(key, events)
+    return list(events)
 
 
-async def create_event(
-    client: Spond,
+def _event_payload(
     group_id: str,
     heading: str,
     start: datetime,
@@ -173,44 +554,20 @@ async def create_event(
     subgroup_id: str | None = None,
     owner_ids: list[str] | None = None,
 ) -> dict[str, Any]:
-    """Create a new availability request in Spond.
-
-    Based on the structure of real events from the Harpenden Colts group.
-    The spond package doesn't expose a create method, so we call the API
-    directly using the authenticated session.
-
-    location_data, if provided, takes precedence over location and should be
-    a dict with keys like feature, address, latitude, longitude, postalCode, etc.
-
-    owner_ids, if provided, sets the event hosts/owners.
-    """
-    if not client.token:
-        await client.login()
-
-    url = f"{client.api_url}sponds/"
-
+    """Build the JSON body for creating an event (see create_event)."""
     meetup = start - timedelta(minutes=meetup_prior)
 
     event_data: dict[str, Any] = {
         "heading": heading,
         "description": description,
-        "startTimestamp": start.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-        "endTimestamp": end.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-        "meetupTimestamp": meetup.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+        "startTimestamp": spond_timestamp(start),
+        "endTimestamp": spond_timestamp(end),
+        "meetupTimestamp": spond_timestamp(meetup),
         "meetupPrior": meetup_prior,
-        "commentsDisabled": False,
-        "maxAccepted": 0,
-        "rsvpDate": None,
-        "visibility": "INVITEES",
-        "participantsHidden": False,
-        "autoReminderType": "DISABLED",
-        "autoAccept": False,
-        "hidden": False,
+        **_EVENT_TEMPLATE,
         "payment": {},
         "attachments": [],
         "tasks": {"openTasks": [], "assignedTasks": []},
-        "type": "AVAILABILITY",
-        "matchEvent": False,
     }
 
     if owner_ids:
@@ -233,13 +590,142 @@ async def create_event(
         recipients["group"]["subGroups"] = [subgroup_id]
 
     event_data["recipients"] = recipients
+    return event_data
 
-    async with client.clientsession.post(
-        url, json=event_data, headers=client.auth_headers
-    ) as r:
-        if not r.ok:
-            error_text = await r.text()
-            raise RuntimeError(
-                f"Failed to create event (HTTP {r.status}): {error_text}"
-            )
-        return await r.json()
+
+async def _post_event(
+    client: Spond,
+    url: str,
+    event_data: dict[str, Any],
+    headers: dict[str, str],
+    token: str | None,
+) -> dict[str, Any]:
+    """POST an event using headers built from token, retrying once on a 401."""
+    body = _dumps(event_data)
+    for attempt in range(2):
+        # headers already set the JSON content type
+        async with client.clientsession.post(url, data=body, headers=headers) as r:
+            # A saved token may have been revoked; log in again and retry once
+            if r.status == 401 and attempt == 0:
+                await _relogin(client, token)
+                headers = client.auth_headers
+                continue
+            if not r.ok:
+                error_text = await r.text()
+                raise RuntimeError(
+                    f"Failed to create event (HTTP {r.status}): {error_text}"
+                )
+            invalidate_list_cache()
+            return await r.json()
+
+
+async def create_event(
+    client: Spond,
+    group_id: str,
+    heading: str,
+    start: datetime,
+    end: datetime,
+    description: str = "",
+    location: str | None = None,
+    location_data: dict[str, Any] | None = None,
+    meetup_prior: int = 30,
+    subgroup_id: str | None = None,
+    owner_ids: list[str] | None = None,
+) -> dict[str, Any]:
+    """Create a new availability request in Spond.
+
+    Based on the structure of real events from the Harpenden Colts group.
+    The spond package doesn't expose a create method, so we call the API
+    directly using the authenticated session.
+
+    location_data, if provided, takes precedence over location and should be
+    a dict with keys like feature, address, latitude, longitude, postalCode, etc.
+
+    owner_ids, if provided, sets the event hosts/owners.
+    """
+    if not client.token:
+        await login(client)
+
+    event_data = _event_payload(
+        group_id,
+        heading,
+        start,
+        end,
+        description=description,
+        location=location,
+        location_data=location_data,
+        meetup_prior=meetup_prior,
+        subgroup_id=subgroup_id,
+        owner_ids=owner_ids,
+    )
+    return await _post_event(
+        client, f"{client.api_url}sponds/", event_data, client.auth_headers, client.token
+    )
+
+
+async def create_events(
+    client: Spond,
+    group_id: str,
+    events: Iterable[dict[str, Any]],
+    owner_ids: list[str] | None = None,
+    concurrency: int = POOL_LIMIT_PER_HOST,
+) -> AsyncIterator[tuple[dict[str, Any], dict[str, Any] | Exception]]:
+    """Create several events, yielding (event, result) pairs as each finishes.
+
+    Spond has no bulk-create endpoint, so this fans single-event POSTs out over
+    the client's keep-alive pool, at most `concurrency` at a time. `events` is
+    consumed lazily; each item holds create_event() keyword arguments. result
+    is the created event, or the exception raised while creating it.
+    """
+    # Log in once up front so concurrent requests don't each trigger a login
+    if not client.token:
+        await login(client)
+
+    pending: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+    done: asyncio.Queue = asyncio.Queue()
+    read_errors: list[Exception] = []
+
+    async def _produce():
+        try:
+            for evt in events:
+                await pending.put(evt)
+        except Exception as e:
+            # Let the workers drain and stop; the error is re-raised below
+            read_errors.append(e)
+        for _ in range(concurrency):
+            await pending.put(None)
+
+    # Built once for the whole batch; refreshed only if a worker logs in again
+    url = f"{client.api_url}sponds/"
+    token = client.token
+    headers = client.auth_headers
+
+    async def _work():
+        nonlocal token, headers
+        while (evt := await pending.get()) is not None:
+            if client.token != token:
+                token, headers = client.token, client.auth_headers
+            try:
+                event_data = _event_payload(group_id, owner_ids=owner_ids, **evt)
+                result = await _post_event(client, url, event_data, headers, token)
+            except Exception as e:
+                result = e
+            await done.put((evt, result))
+        await done.put(None)
+
+    tasks = [asyncio.create_task(_produce())]
+    tasks += [asyncio.create_task(_work()) for _ in range(concurrency)]
+    try:
+        finished = 0
+        while finished < concurrency:
+            item = await done.get()
+            if item is None:
+                finished += 1
+                continue
+            yield item
+        if read_errors:
+            raise read_errors[0]
+    finally:
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -4,17 +4,22 @@ from __future__ import annotations
 
 import asyncio
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from spond.spond import Spond
 
 from .config import get_credentials, get_group_id
-from .spond_client import geocode, get_client
-
-
-def run(coro):
-    return asyncio.run(coro)
+from .spond_client import (
+    fetch_with_relogin,
+    geocode_many,
+    get_client,
+    invalidate_list_cache,
+    list_events,
+    login,
+    run,
+    spond_timestamp,
+)
 
 
 def list_upcoming_events(max_events: int = 20) -> list[dict]:
@@ -25,82 +30,158 @@ def list_upcoming_events(max_events: int = 20) -> list[dict]:
         client = await get_client(u, p)
         try:
             gid = get_group_id()
-            events = await client.get_events(
+            return await list_events(
+                client,
                 group_id=gid,
-                min_start=datetime.utcnow(),
+                min_start=datetime.now(timezone.utc),
                 max_events=max_events,
             )
-            return events or []
         finally:
             await client.clientsession.close()
 
     return run(_list())
 
 
+def _event_summary(e: dict) -> str:
+    start = e.get("startTimestamp", "?")[:16].replace("T", " ")
+    heading = e.get("heading", "(no title)")
+    loc = e.get("location", {}).get("address", "")
+    desc = e.get("description")
+    return (
+        f"  {start}  {heading}\n"
+        f"  ID: {e['id']}\n"
+        + (f"  Location: {loc}\n" if loc else "")
+        + (f"  Description: {desc[:100]}...\n" if desc else "")
+    )
+
+
 def get_event_summary(events: list[dict]) -> str:
     """Format events into a readable summary for matching."""
-    lines = []
-    for e in events:
-        start = e.get("startTimestamp", "?")[:16].replace("T", " ")
-        heading = e.get("heading", "(no title)")
-        eid = e["id"]
-        loc = e.get("location", {}).get("address", "")
-        desc = (e.get("description") or "")[:100]
-        lines.append(f"  {start}  {heading}")
-        lines.append(f"  ID: {eid}")
-        if loc:
-            lines.append(f"  Location: {loc}")
-        if desc:
-            lines.append(f"  Description: {desc}...")
-        lines.append("")
-    return "\n".join(lines)
+    return "\n".join(_event_summary(e) for e in events)
 
 
-def update_event(
-    event_id: str,
+# Max concurrent update requests, to stay clear of Spond's rate limits
+BULK_UPDATE_CONCURRENCY = 8
+
+
+def _build_updates(
     heading: str | None = None,
     start: datetime | None = None,
     end: datetime | None = None,
     meetup_prior: int | None = None,
     description: str | None = None,
-    location_query: str | None = None,
     location_data: dict | None = None,
-) -> dict:
-    """Update an existing Spond event."""
-
-    async def _update():
-        u, p = get_credentials()
-        client = await get_client(u, p)
-        try:
-            updates: dict[str, Any] = {}
-
-            if heading is not None:
-                updates["heading"] = heading
+) -> dict[str, Any]:
+    """Build the Spond update payload for an event."""
+    updates: dict[str, Any] = {}
+
+    if heading is not None:
+        updates["heading"] = heading
+
+    if start is not None:
+        updates["startTimestamp"] = spond_timestamp(start)
+        if meetup_prior is not None:
+            meetup = start - timedelta(minutes=meetup_prior)
+            updates["meetupTimestamp"] = spond_timestamp(meetup)
+            updates["meetupPrior"] = meetup_prior
+
+    if end is not None:
+        updates["endTimestamp"] = spond_timestamp(end)
+
+    if description is not None:
+        updates["description"] = description
+
+    if location_data is not None:
+        updates["location"] = location_data
+
+    return updates
+
+
+async def _update_events(items: list[dict]) -> list[dict | BaseException]:
+    """Apply updates to several events over one logged-in client."""
+    u, p = get_credentials()
+    client = await get_client(u, p)
+    try:
+        # Log in and load events once, rather than in every concurrent update.
+        # spond's update_event() looks events up in client.events.
+        if not client.token:
+            await login(client)
+        if not client.events:
+            await fetch_with_relogin(client, client.get_events, "events")
+        # Geocode each distinct venue once up front, so geocode_many() can keep
+        # to Nominatim's rate limit, rather than inside the concurrent updates
+        queries = list(
+            dict.fromkeys(
+                item["location_query"]
+                for item in items
+                if item.get("location_query") is not None
+                and item.get("location_data") is None
+            )
+        )
+        geo_map = dict(zip(queries, await geocode_many(queries)))
+        sem = asyncio.Semaphore(BULK_UPDATE_CONCURRENCY)
+
+        async def _one(item: dict) -> dict:
+            fields = dict(item)
+            event_id = fields.pop("event_id")
+            query = fields.pop("location_query", None)
+            if query is not None and fields.get("location_data") is None:
+                fields["location_data"] = geo_map[query]
+                if fields["location_data"] is None:
+                    raise ValueError(f"Could not geocode location '{query}'")
+            updates = _build_updates(**fields)
+            async with sem:
+                await client.update_event(event_id, updates)
+            return {"status": "ok", "updates": updates}
 
-            if start is not None:
-                updates["startTimestamp"] = start.strftime("%Y-%m-%dT%H:%M:%S.000Z")
-                if meetup_prior is not None:
-                    meetup = start - timedelta(minutes=meetup_prior)
-                    updates["meetupTimestamp"] = meetup.strftime(
-                        "%Y-%m-%dT%H:%M:%S.000Z"
-                    )
-                    updates["meetupPrior"] = meetup_prior
+        results = await asyncio.gather(*map(_one, items), return_exceptions=True)
+        invalidate_list_cache()
+        return results
+    finally:
+        await client.clientsession.close()
 
-            if end is not None:
-                updates["endTimestamp"] = end.strftime("%Y-%m-%dT%H:%M:%S.000Z")
 
-            if description is not None:
-                updates["description"] = description
+def update_events_bulk(items: list[dict]) -> list[dict]:
+    """Update several Spond events with a single login.
 
-            loc = location_data
-            if loc is None and location_query is not None:
-                loc = await geocode(location_query)
-            if loc is not None:
-                updates["location"] = loc
+    Each item holds update_event() keyword arguments, including event_id.
+    Returns one result per item, in order: {"status": "ok", "updates": ...}
+    or {"status": "error", "error": "..."} if that update failed.
+    """
+    results = run(_update_events(items))
+    return [
+        {"status": "error", "error": str(r)} if isinstance(r, BaseException) else r
+        for r in results
+    ]
 
-            result = await client.update_event(event_id, updates)
-            return {"status": "ok", "updates": updates}
-        finally:
-            await client.clientsession.close()
 
-    return run(_update())
+def update_event(
+    event_id: str,
+    heading: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    meetup_prior: int | None = None,
+    description: str | None = None,
+    location_query: str | None = None,
+    location_data: dict | None = None,
+) -> dict:
+    """Update an existing Spond event."""
+    (result,) = run(
+        _update_events(
+            [
+                {
+                    "event_id": event_id,
+                    "heading": heading,
+                    "start": start,
+                    "end": end,
+                    "meetup_prior": meetup_prior,
+                    "description": description,
+                    "location_query": location_query,
+                    "location_data": location_data,
+                }
+            ]
+        )
+    )
+    if isinstance(result, BaseException):
+        raise result
+    return result